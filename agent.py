@@ -1,4 +1,7 @@
 from __future__ import annotations
+import atexit
+import signal
+import sys
 import time
 import os
 from typing import Dict, Any
@@ -55,7 +58,7 @@ def load_config(path: str = "config.yml") -> Dict[str, Any]:
     
     return config
 
-def build_snapshot_payload(iface: str) -> Dict[str, Any]:
+def build_snapshot_payload(sys_net: SysNet, proc_snmp: ProcNetSnmp, softnet: SoftnetStat) -> Dict[str, Any]:
     """
     Build a snapshot payload containing network metrics from various sources.
     
@@ -63,16 +66,21 @@ def build_snapshot_payload(iface: str) -> Dict[str, Any]:
     - SysNet: /sys/class/net/{iface}/carrier and statistics
     - ProcNetSnmp: /proc/net/snmp (IP/UDP/TCP counters)
     
+    Collectors are created once by the caller and reused every poll, so
+    they can keep their file descriptors open between cycles.
+    
     Args:
-        iface: Network interface name to collect data for
+        sys_net: Collector for the monitored network interface
+        proc_snmp: Collector for /proc/net/snmp
+        softnet: Collector for /proc/net/softnet_stat
         
     Returns:
         Dictionary containing network metrics snapshot
     """
     # Core sources
-    sysn  = SysNet(iface).read()                # /sys/carrier(_changes) + statistics/*
-    snmp  = ProcNetSnmp().read()                # /proc/net/snmp (Ip/Udp)
-    softn = SoftnetStat().read()               # /proc/net/softnet_stat
+    sysn  = sys_net.read()                      # /sys/carrier(_changes) + statistics/*
+    snmp  = proc_snmp.read()                    # /proc/net/snmp (Ip/Udp)
+    softn = softnet.read()                      # /proc/net/softnet_stat
 
     payload = {
         "sys_net": sysn,
@@ -102,36 +110,33 @@ def main() -> None:
     interval = float(cfg.get("poll_interval_sec", 1.0))
     out_cfg = cfg.get("output", {"path": "./events.ndjson"})
     sink = JsonSink(out_cfg["path"])
+    atexit.register(sink.close)
+
+    # turn SIGTERM into a normal exit so the atexit handlers flush the sink
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
 
     host = hostname()
     seq = 0
     agg = Aggregator()
+    sys_net = SysNet(iface)
+    proc_snmp = ProcNetSnmp()
+    softnet = SoftnetStat()
+    for collector in (sys_net, proc_snmp, softnet):
+        atexit.register(collector.close)
 
+    # schedule polls against the monotonic clock so the work done per cycle
+    # does not add up to a drifting cadence; now_ts() only labels records
+    next_deadline = time.monotonic()
     while True:
         ts = now_ts()
-        payload_snapshot = build_snapshot_payload(iface)
-
-        # Build numeric tree for delta genaration. Ingore non-counter
-        payload_delta = agg.update({
-            "sys_net": {
-                "carrier_changes" : payload_snapshot["sys_net"].get("carrier_changes", {}),
-                "statistics": payload_snapshot["sys_net"].get("statistics", {})
-            },
-            "snmp": {
-                "Ip":  payload_snapshot["snmp"].get("Ip", {}),
-                "Udp": payload_snapshot["snmp"].get("Udp", {})
-            },
-            "softnet": {
-                "dropped": payload_snapshot["softnet"].get("dropped", 0),
-            }
-        })
-        
-        # remove not changed deltas
-        payload_delta = {k:v for k,v in payload_delta.items() if isinstance(v,(int,float)) and v != 0}
+        payload_snapshot = build_snapshot_payload(sys_net, proc_snmp, softnet)
+
+        # Counter deltas straight from the snapshot (non-zero numeric only)
+        payload_delta = agg.update(payload_snapshot)
 
         # SNAPSHOT record
         seq += 1
-        sink.write({
+        records = [{
             "schema_version": SCHEMA_VERSION,
             "record_type": "snapshot",
             "host": host,
@@ -140,12 +145,12 @@ def main() -> None:
             "seq": seq,
             "payload": payload_snapshot,
             "meta": {"interval_sec": interval}
-        })
+        }]
 
         # DELTA record (if exists)
         if payload_delta:
             seq += 1
-            sink.write({
+            records.append({
                 "schema_version": SCHEMA_VERSION,
                 "record_type": "delta",
                 "host": host,
@@ -156,7 +161,16 @@ def main() -> None:
                 "meta": {"interval_sec": interval}
             })
 
-        time.sleep(interval)
+        sink.write_many(records)
+
+        next_deadline += interval
+        delay = next_deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -interval:
+            # fell behind by more than a full cycle (e.g. suspend): resync
+            # instead of firing a burst of catch-up polls
+            next_deadline = time.monotonic()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Dict, List
+from operator import itemgetter
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from core.util import PersistentFile
 
 SOURCE = "/proc/net/snmp"
 
@@ -8,6 +11,9 @@ NEEDED_COUNTERS = {
     'Udp': {'InCsumErrors', 'RcvbufErrors', 'InErrors', 'SndbufErrors'}
 }
 
+# (header line index, header line, section, counter names, column getter)
+_Step = Tuple[int, bytes, str, Tuple[str, ...], Callable[[Sequence[bytes]], Tuple[bytes, ...]]]
+
 class ProcNetSnmp:
     """
     Collector for SNMP network statistics from /proc/net/snmp.
@@ -16,6 +22,49 @@ class ProcNetSnmp:
     defined in an internal dictonary called NEEDED_COUNTERS.
     """
     
+    def __init__(self) -> None:
+        """Initialize collector; the file is opened lazily on first read."""
+        self._file = PersistentFile(SOURCE)
+        self._last_raw: bytes | None = None
+        self._last: Dict[str, Dict[str, int]] = {}
+        # parse plan specialized to the current file layout, see _compile()
+        self._plan: List[_Step] | None = None
+
+    def _compile(self, lines: List[bytes]) -> List[_Step]:
+        """
+        Specialize the parser to the header lines of the file.
+        
+        The column positions of NEEDED_COUNTERS only change if the kernel's
+        header lines change, so they are resolved once into fixed steps.
+        
+        Args:
+            lines: Lines of /proc/net/snmp (header/value pairs)
+            
+        Returns:
+            One step per needed section: header line index, header bytes,
+            section name, counter names and a getter for their columns.
+        """
+        plan: List[_Step] = []
+        for i in range(0, len(lines) - 1, 2):
+            names = lines[i].decode().split()
+            section = names[0].rstrip(":")
+            if section not in NEEDED_COUNTERS:
+                continue
+            # column 0 of the value line is the "Ip:" label
+            cols = [(name, col) for col, name in enumerate(names) if name in NEEDED_COUNTERS[section]]
+            counters = tuple(name for name, _ in cols)
+            if len(cols) > 1:
+                getter = itemgetter(*(col for _, col in cols))
+            else:
+                # itemgetter() with one index returns a bare value, not a tuple
+                getter = lambda vals, idx=tuple(col for _, col in cols): tuple(vals[c] for c in idx)
+            plan.append((i, lines[i], section, counters, getter))
+        return plan
+
+    def close(self) -> None:
+        """Close the cached file descriptor."""
+        self._file.close()
+
     def read(self) -> Dict[str, Dict[str, int]]:
         """
         Read and parse SNMP statistics from /proc/net/snmp.
@@ -24,31 +73,23 @@ class ProcNetSnmp:
             Dictionary mapping protocol names to their counter values.
             Only includes protocols and counters defined in NEEDED_COUNTERS.
             Also includes a '_source' key with the file path.
+            The previous dict is returned as-is if the file did not change.
         """
+        raw = self._file.read()
+        if raw == self._last_raw:
+            return self._last
+
         out: Dict[str, Dict[str, int]] = {}
         
-        with open(SOURCE, "r", encoding="utf-8") as f:
-            lines = [l.strip() for l in f if l.strip()]
-        
-        for i in range(0, len(lines), 2):
-            header = lines[i]; 
-            values = lines[i+1]
-            
-            section = header.split(":")[0]
-            
-            if section not in NEEDED_COUNTERS:
-                continue
-            
-            keys: List[str] = header.split(":")[1].split()
-            vals = list(map(int, values.split(":")[1].split()))
-            
-            protocol_dict = {}
-            for counter, value in zip(keys, vals):
-                if counter in NEEDED_COUNTERS[section]:
-                    protocol_dict[counter] = value
-            
-            out[section] = protocol_dict
+        lines = raw.splitlines()
+        plan = self._plan
+        if plan is None or any(i + 1 >= len(lines) or lines[i] != header for i, header, *_ in plan):
+            plan = self._plan = self._compile(lines)
+        for i, _, section, counters, getter in plan:
+            out[section] = dict(zip(counters, map(int, getter(lines[i+1].split()))))
         
         out["_source"] = SOURCE
         
+        self._last_raw = raw
+        self._last = out
         return out
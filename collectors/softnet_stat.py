@@ -1,24 +1,44 @@
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict
+
+from core.util import PersistentFile
 
 SOURCE = "/proc/net/softnet_stat"
+ROW_MIN = 27  # three 8-digit hex columns plus separators and newline
 
 class SoftnetStat:
     """
     Sums 'dropped' and 'time_squeeze' across all CPUs.
     Fields are hexadecimal: 0=processed, 1=dropped, 2=time_squeeze, ...
     """
+    def __init__(self) -> None:
+        self._file = PersistentFile(SOURCE)
+        self._last_raw: bytes | None = None
+        self._last: Dict[str, int | str] = {}
+
+    def close(self) -> None:
+        self._file.close()
+
     def read(self) -> Dict[str, int | str]:
         total_dropped = 0
         try:
-            with open(SOURCE, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+            raw = self._file.read()
+            if raw == self._last_raw:
+                return self._last
+            # every line is "%08x %08x ...\n" with the same column count, so
+            # the dropped column sits at a fixed offset in each row
+            stride = raw.find(b"\n") + 1
+            rows = len(raw) // stride if stride >= ROW_MIN else 0
+            if rows and raw[stride - 1::stride] == b"\n" * rows and len(raw) == rows * stride:
+                for off in range(9, len(raw), stride):
+                    total_dropped += int(raw[off:off + 8], 16)
+            else:
+                for line in raw.splitlines():
                     cols = line.split()
                     if len(cols) >= 3:
                         total_dropped += int(cols[1], 16)
-            return {"_source": SOURCE, "dropped": total_dropped}
+            self._last_raw = raw
+            self._last = {"_source": SOURCE, "dropped": total_dropped}
+            return self._last
         except FileNotFoundError:
             return {"_source": SOURCE, "dropped": 0}
@@ -2,6 +2,8 @@ from __future__ import annotations
 import os
 from typing import Dict
 
+from core.util import PersistentFile
+
 SOURCE_CARRIER = "/sys/class/net/{iface}/carrier"
 SOURCE_STATS = "/sys/class/net/{iface}/statistics"
 
@@ -23,6 +25,46 @@ class SysNet:
             iface: Network interface name (e.g., 'eth0', 'enp0s31f6')
         """
         self.iface = iface
+        self._carrier = PersistentFile(SOURCE_CARRIER.format(iface=iface))
+        self._carrier_changes = PersistentFile(SOURCE_CARRIER.format(iface=iface) + "_changes")
+        self._stats_dir_fd: int | None = None
+        self._stats_files: Dict[str, PersistentFile] | None = None
+        # raw file contents of the last poll and the dict parsed from them
+        self._stats_raw: Dict[str, bytes] = {}
+        self._stats: Dict[str, int] = {}
+        self._last: Dict[str, object] = {}
+
+    def _open_stats(self) -> Dict[str, PersistentFile]:
+        """
+        Enumerate the statistics directory once and keep its files open.
+
+        The set of counter files is fixed per driver, so it is only listed
+        again after the interface disappeared. The directory itself stays
+        open as well and the counter files are opened relative to it.
+
+        Returns:
+            Dictionary mapping counter names to their persistent files
+        """
+        dir_fd = os.open(SOURCE_STATS.format(iface=self.iface), os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+        try:
+            names = os.listdir(dir_fd)
+        except OSError:
+            os.close(dir_fd)
+            raise
+        self._stats_dir_fd = dir_fd
+        return {name: PersistentFile(name, dir_fd=dir_fd) for name in names}
+
+    def close(self) -> None:
+        """Close all cached file descriptors."""
+        self._carrier.close()
+        self._carrier_changes.close()
+        if self._stats_files is not None:
+            for f in self._stats_files.values():
+                f.close()
+            self._stats_files = None
+        if self._stats_dir_fd is not None:
+            os.close(self._stats_dir_fd)
+            self._stats_dir_fd = None
 
     def read(self) -> Dict[str, object]:
         """
@@ -34,37 +76,58 @@ class SysNet:
             - carrier_changes: Number of link state changes
             - statistics: Dict of interface statistics (rx/tx counters, errors)
             - _source: Source file paths
+            The previous dict is returned as-is if nothing changed.
         """
         out: Dict[str, object] = {"_source": f"{SOURCE_CARRIER.format(iface=self.iface)}, {SOURCE_STATS.format(iface=self.iface)}"}
         
         # carrier
         try:
-            with open(SOURCE_CARRIER.format(iface=self.iface), "r", encoding="utf-8") as f:
-                out["carrier"] = f.read().strip()  # "up = 1" | "down = 0"
-        except FileNotFoundError:
+            out["carrier"] = self._carrier.read().decode().strip()  # "up = 1" | "down = 0"
+        except OSError:
             out["carrier"] = "unknown"
 
         try:
-            with open(SOURCE_CARRIER.format(iface=self.iface) + "_changes", "r", encoding="utf-8") as f:
-                out["carrier_changes"] = f.read().strip()  # changes of the carrier value
-        except FileNotFoundError:
+            out["carrier_changes"] = self._carrier_changes.read().decode().strip()  # changes of the carrier value
+        except OSError:
             pass
 
         # statistics/*
-        stats_dir = SOURCE_STATS.format(iface=self.iface)
-        stats: Dict[str, int] = {}
+        raw: Dict[str, bytes] = {}
         try:
-            for name in os.listdir(stats_dir):
-                p = os.path.join(stats_dir, name)
+            if self._stats_files is None:
+                self._stats_files = self._open_stats()
+            for name, f in self._stats_files.items():
                 try:
-                    with open(p, "r", encoding="utf-8") as f:
-                        v = int(f.read().strip())
-                        stats[name] = v
-                except (FileNotFoundError, ValueError):
+                    raw[name] = f.read()
+                except OSError:
                     continue
+            if not raw:
+                # interface vanished: enumerate the directory again next poll
+                self.close()
         except FileNotFoundError:
             pass
 
-        out["statistics"] = stats
+        # reuse the parsed dict while no counter file changed (idle link)
+        if raw != self._stats_raw:
+            # int() parses the raw bytes directly and ignores the trailing
+            # newline, so no decode or strip() copy is needed
+            try:
+                stats: Dict[str, int] = dict(zip(raw, map(int, raw.values())))
+            except ValueError:
+                stats = {}
+                for name, buf in raw.items():
+                    try:
+                        stats[name] = int(buf)
+                    except ValueError:
+                        continue
+            self._stats_raw = raw
+            self._stats = stats
+
+        out["statistics"] = self._stats
         
+        # hand out the previous dict on an idle link so the Aggregator can
+        # skip it by identity (the statistics dict compares by identity)
+        if out == self._last:
+            return self._last
+        self._last = out
         return out
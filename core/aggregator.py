@@ -1,14 +1,27 @@
 from __future__ import annotations
-from typing import Any, Dict
+from itertools import compress
+from operator import ne
+from typing import Any, Dict, List
+
+from core.schema import Schema
 
 class Aggregator:
     """
     Calculates deltas between consecutive metric snapshots.
+    
+    The snapshot layout is stable between polls, so it is recorded once
+    as a Schema and each snapshot is flattened into one list of counter
+    values in schema order. Changed slots are found with one element-wise
+    comparison of the two flat lists and only those are subtracted,
+    instead of walking the nested dicts. A recursive diff is only used for
+    the poll in which the layout changes.
     """
     
     def __init__(self) -> None:
         """Initialize aggregator with no previous snapshot."""
         self._prev: Dict[str, Any] | None = None
+        self._schema: Schema | None = None
+        self._prev_num: List[int] = []
 
     def update(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -18,20 +31,56 @@ class Aggregator:
             snapshot: Current metrics snapshot
             
         Returns:
-            Dictionary containing delta values for numeric counters.
+            Dictionary mapping dotted counter paths to their non-zero
+            deltas. Only integer leaves are counters; strings such as
+            source paths or the carrier state are ignored.
             Empty dict on first call (no previous snapshot available).
         """
         if self._prev is None:
+            self._learn(snapshot)
+            return {}
+        prev = self._prev
+        if snapshot.keys() == prev.keys() and all(snapshot[k] is prev[k] for k in snapshot):
+            # every collector handed out its cached result: nothing changed
             self._prev = snapshot
             return {}
         deltas: Dict[str, Any] = {}
-        self._diff("", self._prev, snapshot, deltas)
+        try:
+            num = self._schema.values(snapshot)
+            prev_num = self._prev_num
+            if num != prev_num:
+                # mask of changed slots in C; Python only visits those
+                keys = self._schema.keys
+                for i in compress(range(len(num)), map(ne, num, prev_num)):
+                    d = num[i] - prev_num[i]
+                    if d < 0:
+                        d = num[i]  # reset/wrap
+                    if d:
+                        deltas[keys[i]] = d
+        except (KeyError, AttributeError, TypeError):
+            # layout changed: diff recursively once and re-learn the layout
+            deltas = {}
+            self._diff("", self._prev, snapshot, deltas)
+            self._learn(snapshot)
+            return deltas
         self._prev = snapshot
+        self._prev_num = num
         return deltas
 
+    def _learn(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Record the schema of a snapshot and keep its flattened values.
+        
+        Args:
+            snapshot: Snapshot whose layout should be recorded
+        """
+        self._schema = Schema(snapshot)
+        self._prev = snapshot
+        self._prev_num = self._schema.values(snapshot)
+
     def _diff(self, path: str, a: Any, b: Any, out: Dict[str, Any]) -> None:
         """
-        Recursively calculate differences between two values.
+        Recursively calculate differences between two counter values.
         
         Args:
             path: Dot-separated path to current value in nested dict
@@ -44,13 +93,11 @@ class Aggregator:
                 if k in a:
                     key = f"{path}.{k}" if path else k
                     self._diff(key, a[k], b[k], out)
+        elif a == b:
+            return
         elif isinstance(a, int) and isinstance(b, int):
             d = b - a
             if d < 0:
                 d = b  # reset/wrap
-            out[path] = d
-        elif isinstance(a, float) and isinstance(b, float):
-            out[path] = b - a
-        else:
-            if a != b:
-                out[path] = b
+            if d:
+                out[path] = d
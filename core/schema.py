@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# (key chain to a nested dict, its key set or None if already checked by an
+#  earlier group of the same dict, int leaf keys, other leaf keys)
+_Group = Tuple[Tuple[str, ...], Optional[FrozenSet[str]], Tuple[str, ...], Tuple[str, ...]]
+
+class Schema:
+    """
+    Static layout of a nested metrics snapshot.
+    
+    Separates the structure of a snapshot (which counters exist and where)
+    from its values. Integer counters get a fixed slot each; other leaves
+    (source paths, carrier state, ...) are only part of the layout. A
+    snapshot with the same layout is flattened into a dense list of values
+    in slot order, so consumers can work on plain sequences instead of
+    nested dicts.
+    
+    Values are kept as full-width ints and never narrowed to 32 bits: the
+    sysfs statistics are 64-bit counters (byte counters pass 2**32 within
+    seconds at line rate) and the reset/wrap detection in the Aggregator
+    relies on seeing the kernel's value unchanged.
+    """
+    
+    def __init__(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Record the layout of a snapshot.
+        
+        Args:
+            snapshot: Nested metrics snapshot
+        """
+        groups: List[_Group] = []
+        keys: List[str] = []
+        self._walk((), snapshot, groups, keys)
+        self._groups = groups
+        # dotted paths of the integer counters, in slot order
+        self.keys: Tuple[str, ...] = tuple(keys)
+        # dotted path -> slot
+        self.indices: Dict[str, int] = {k: i for i, k in enumerate(keys)}
+
+    def _walk(self, chain: Tuple[str, ...], node: Dict[str, Any], groups: List[_Group], keys: List[str]) -> None:
+        """
+        Record one dict depth-first, in the snapshot's own key order.
+        
+        Leaves are grouped into runs between sub-dicts, so slots follow the
+        same order a recursive walk over the snapshot would produce.
+        
+        Args:
+            chain: Key chain from the snapshot root to `node`
+            node: Dict to record
+            groups: Output list of groups
+            keys: Output list of dotted counter paths
+        """
+        prefix = ".".join(chain)
+        key_set: FrozenSet[str] | None = frozenset(node)
+        num_leaves: List[str] = []
+        other_leaves: List[str] = []
+        for k, v in node.items():
+            if isinstance(v, dict):
+                if key_set is not None or num_leaves or other_leaves:
+                    groups.append((chain, key_set, tuple(num_leaves), tuple(other_leaves)))
+                    key_set, num_leaves, other_leaves = None, [], []
+                self._walk(chain + (k,), v, groups, keys)
+            elif isinstance(v, int):
+                num_leaves.append(k)
+                keys.append(f"{prefix}.{k}" if prefix else k)
+            else:
+                other_leaves.append(k)
+        if key_set is not None or num_leaves or other_leaves:
+            groups.append((chain, key_set, tuple(num_leaves), tuple(other_leaves)))
+
+    def values(self, snapshot: Dict[str, Any]) -> List[int]:
+        """
+        Flatten a snapshot into slot order.
+        
+        Args:
+            snapshot: Snapshot with the recorded layout
+            
+        Returns:
+            Integer counter values ordered like `keys`
+            
+        Raises:
+            KeyError: If the layout of the snapshot differs from the
+                recorded one
+        """
+        num: List[int] = []
+        for chain, key_set, num_leaves, other_leaves in self._groups:
+            node = snapshot
+            for k in chain:
+                node = node[k]
+            if key_set is not None and node.keys() != key_set:
+                raise KeyError(".".join(chain))
+            num.extend(map(node.__getitem__, num_leaves))
+            for k in other_leaves:
+                if isinstance(node[k], (int, dict)):
+                    raise KeyError(k)  # turned into a counter or subtree
+        return num
@@ -28,3 +28,77 @@ def ensure_parent(path: str | os.PathLike) -> None:
         path: File path whose parent directories should be created
     """
     pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+class PersistentFile:
+    """
+    Read-only file descriptor that stays open across polling cycles.
+
+    procfs/sysfs files regenerate their content on every read while the
+    inode stays stable, so the descriptor is opened lazily once and every
+    read is a run of preadv() calls from offset 0 until EOF instead of
+    open/read/close.
+
+    All instances read into one preallocated buffer shared by the
+    collectors. A new bytes object is only created when the content
+    differs from the previous read; otherwise the previous object is
+    returned again.
+    """
+
+    _buf = bytearray(8192)
+    _view = memoryview(_buf)
+
+    def __init__(self, path: str, dir_fd: int | None = None) -> None:
+        """
+        Initialize the file wrapper without opening it yet.
+
+        Args:
+            path: Path of the procfs/sysfs file
+            dir_fd: Open directory descriptor that a relative path is
+                resolved against (saves the full path walk on open)
+        """
+        self.path = path
+        self.dir_fd = dir_fd
+        self._fd: int | None = None
+        self._last: bytes | None = None
+
+    def read(self) -> bytes:
+        """
+        Read the whole file content from offset 0.
+
+        Returns:
+            Raw file content as bytes; the same object as the previous
+            call if the content did not change
+
+        Raises:
+            OSError: If the file cannot be opened or read. The descriptor is
+                closed so the next call reopens the path.
+        """
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC, dir_fd=self.dir_fd)
+        try:
+            # seq_file based procfs files return at most about a page per
+            # read, so a short read is not EOF: keep appending until 0 bytes
+            offset = 0
+            while True:
+                if offset == len(PersistentFile._buf):
+                    buf = bytearray(2 * offset)
+                    buf[:offset] = PersistentFile._buf
+                    PersistentFile._buf = buf
+                    PersistentFile._view = memoryview(buf)
+                n = os.preadv(self._fd, [PersistentFile._view[offset:]], offset)
+                if n == 0:
+                    break
+                offset += n
+        except OSError:
+            self.close()
+            raise
+        data = PersistentFile._view[:offset]
+        if self._last is None or data != self._last:
+            self._last = data.tobytes()
+        return self._last
+
+    def close(self) -> None:
+        """Close the descriptor if it is open."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
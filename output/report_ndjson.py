@@ -7,49 +7,75 @@ Usage:
     python3 report_ndjson.py /path/to/events.ndjson
 """
 
+import mmap
+import os
+import re
+import stat
 import sys
 import json
 from collections import defaultdict, OrderedDict
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Iterator
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # the stdlib decoder accepts bytes as well
+    _loads = json.loads
 
 # ---------------------- Mapping Rules ----------------------
 
-def map_bucket(key: str) -> Tuple[str, str]:
-    """
-    Maps a metric key to a (Layer, Component) pair.
-    Layer: L1/L2/L3/L4/Other
-    Component: Finer subdivision (e.g., NIC/MAC vs. KernelPath)
-    """
+# (Layer, Component) per rule, checked in order; the first match wins.
+# Layer: L1/L2/L3/L4/Other
+# Component: Finer subdivision (e.g., NIC/MAC vs. KernelPath)
+BUCKET_RULES = [
     # L1 Physical
-    if key.startswith("sys_net.") and key.endswith(".rx_crc_errors"):
-        return ("L1:Physical", "CRC/Signal")
-
+    (("L1:Physical", "CRC/Signal"), "sys_net.", ("$.rx_crc_errors",)),
     # L2 DataLink (NIC/MAC)
-    if key.startswith("sys_net.") and any(
-        s in key for s in (
-            ".rx_dropped", ".rx_missed_errors", ".collisions",
-            ".tx_errors", ".tx_carrier_errors", ".tx_window_errors"
-        )
-    ):
-        return ("L2:DataLink", "NIC/MAC")
-
+    (("L2:DataLink", "NIC/MAC"), "sys_net.", (
+        ".rx_dropped", ".rx_missed_errors", ".collisions",
+        ".tx_errors", ".tx_carrier_errors", ".tx_window_errors"
+    )),
     # L2 DataLink (KernelPath)
-    if key.startswith("softnet."):
-        return ("L2:DataLink", "KernelPath")
-
+    (("L2:DataLink", "KernelPath"), "softnet.", ()),
     # L3 Network
-    if key.startswith("snmp.Ip.") and any(
-        s in key for s in ("OutNoRoutes", "FragFails", "ReasmFails")
-    ):
-        return ("L3:Network", "IP")
-
+    (("L3:Network", "IP"), "snmp.Ip.", ("OutNoRoutes", "FragFails", "ReasmFails")),
     # L4 UDP
-    if key.startswith("snmp.Udp.") and any(
-        s in key for s in ("InErrors", "InCsumErrors", "RcvbufErrors", "SndbufErrors", "NoPorts")
-    ):
-        return ("L4:UDP", "UDP")
+    (("L4:UDP", "UDP"), "snmp.Udp.", ("InErrors", "InCsumErrors", "RcvbufErrors", "SndbufErrors", "NoPorts")),
+]
 
-    return ("Other", "Other")
+def _compile_rules() -> "re.Pattern[str]":
+    """
+    Compiles BUCKET_RULES into one alternation, one named group per rule.
+    A rule matches keys with its prefix that contain one of its substrings
+    ("$" marks a suffix instead). Alternatives are tried in rule order.
+    """
+    alternatives = []
+    for i, (_, prefix, parts) in enumerate(BUCKET_RULES):
+        needles = "|".join(
+            re.escape(p[1:]) + r"\Z" if p.startswith("$") else re.escape(p)
+            for p in parts
+        )
+        # lookahead for the prefix so substrings may overlap with it
+        body = f"(?={re.escape(prefix)}).*?(?:{needles})" if needles else re.escape(prefix)
+        alternatives.append(f"(?P<r{i}>{body})")
+    return re.compile("|".join(alternatives), re.DOTALL)
+
+_BUCKET_RE = _compile_rules()
+_bucket_cache: Dict[str, Tuple[str, str]] = {}
+
+def map_bucket(key: str) -> Tuple[str, str]:
+    """
+    Maps a metric key to a (Layer, Component) pair.
+    Layer: L1/L2/L3/L4/Other
+    Component: Finer subdivision (e.g., NIC/MAC vs. KernelPath)
+    Results are memoized, keys repeat on every delta record.
+    """
+    bucket = _bucket_cache.get(key)
+    if bucket is None:
+        m = _BUCKET_RE.match(key)
+        bucket = BUCKET_RULES[int(m.lastgroup[1:])][0] if m else ("Other", "Other")
+        _bucket_cache[key] = bucket
+    return bucket
 
 def source_of(key: str) -> str:
     """
@@ -66,6 +92,30 @@ def source_of(key: str) -> str:
 
 # ---------------------- Analysis ----------------------
 
+def iter_lines(path: str) -> Iterator[bytes]:
+    """
+    Yields the non-empty lines of a file as bytes.
+    Regular files are memory-mapped and split with find(), so no per-line
+    buffered read or decode happens before parsing. Pipes, FIFOs and other
+    non-mappable inputs are read line by line from the binary file object.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while (nl := mm.find(b"\n", start)) != -1:
+                if nl > start:
+                    yield mm[start:nl]
+                start = nl + 1
+            if start < len(mm):
+                yield mm[start:]
+
 def fmt_pct(n: float) -> str:
     return f"{n:5.1f}%"
 
@@ -74,32 +124,32 @@ def main(path: str) -> None:
     totals_global = 0
     by_layer: Dict[str, int] = defaultdict(int)
     by_layer_comp: Dict[Tuple[str, str], int] = defaultdict(int)
-    by_counter: Dict[str, int] = defaultdict(int)
+    # (Layer, Component) -> counter -> sum, filled while reading
+    by_bucket_counters: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(dict)
     counter_src: Dict[str, str] = {}
 
     # Read NDJSON
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if rec.get("record_type") != "delta":
-                continue
-            payload = rec.get("payload", {})
-            if not isinstance(payload, dict):
-                continue
-            for k, v in payload.items():
-                if isinstance(v, (int, float)) and v != 0:
-                    layer, comp = map_bucket(k)
-                    by_counter[k] += int(v)
-                    by_layer[layer] += int(v)
-                    by_layer_comp[(layer, comp)] += int(v)
-                    totals_global += int(v)
-                    counter_src.setdefault(k, source_of(k))
+    for line in iter_lines(path):
+        try:
+            rec = _loads(line)
+        except ValueError:
+            continue
+        if rec.get("record_type") != "delta":
+            continue
+        payload = rec.get("payload", {})
+        if not isinstance(payload, dict):
+            continue
+        for k, v in payload.items():
+            if isinstance(v, (int, float)) and v != 0:
+                n = int(v)
+                bucket = map_bucket(k)
+                counters = by_bucket_counters[bucket]
+                counters[k] = counters.get(k, 0) + n
+                by_layer[bucket[0]] += n
+                by_layer_comp[bucket] += n
+                totals_global += n
+                if k not in counter_src:
+                    counter_src[k] = source_of(k)
 
     if totals_global == 0:
         print("No numeric delta values > 0 found.")
@@ -133,8 +183,7 @@ def main(path: str) -> None:
                   f"Share of total: {fmt_pct(comp_sum/totals_global*100)})")
 
             # All counters of this component, sorted by value
-            counters = [(k, v) for k, v in by_counter.items() if map_bucket(k) == (layer, comp)]
-            counters.sort(key=lambda kv: -kv[1])
+            counters = sorted(by_bucket_counters[(layer, comp)].items(), key=lambda kv: -kv[1])
 
             # Print all counters
             for k, v in counters: